@@ -30,7 +30,7 @@ class DefaultFileBasedAvailabilityStrategy(AbstractFileBasedAvailabilityStrategy
         try:
             self._check_list_files(stream)
         except CheckAvailabilityError:
-            return False, "".join(traceback.format_exc())
+            return False, traceback.format_exc()
 
         return True, None
 
@@ -63,7 +63,7 @@ class DefaultFileBasedAvailabilityStrategy(AbstractFileBasedAvailabilityStrategy
                 handle = stream.stream_reader.open_file(file, parser.file_read_mode, None, logger)
                 handle.close()
         except CheckAvailabilityError:
-            return False, "".join(traceback.format_exc())
+            return False, traceback.format_exc()
 
         return True, None
 
@@ -79,7 +79,7 @@ class FileBasedSource(AbstractSource, ABC):
                     reason,
                 ) = stream.availability_strategy.check_availability_and_parsability(stream, logger, self)
             except Exception:
-                errors.append(f"Unable to connect to stream {stream} - {''.join(traceback.format_exc())}")
+                errors.append(f"Unable to connect to stream {stream} - {traceback.format_exc()}")
             else:
                 if not stream_is_available and reason:
                     errors.append(reason)
@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
+import os
 from io import BytesIO, IOBase
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.config.unstructured_format import UnstructuredFormat
@@ -12,23 +13,31 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
-from unstructured.documents.elements import Formula, ListItem, Title
 from unstructured.file_utils.filetype import STR_TO_FILETYPE, FileType, detect_filetype
 
+# extensions of the supported file types, checked before falling back to detect_filetype
+_EXTENSION_TO_FILETYPE = {
+    ".md": FileType.MD,
+    ".pdf": FileType.PDF,
+    ".docx": FileType.DOCX,
+    ".pptx": FileType.PPTX,
+}
+
+_unstructured_imported = False
 unstructured_partition_pdf = None
 unstructured_partition_docx = None
 unstructured_partition_pptx = None
-unstructured_optional_decode = None
 
 
 def _import_unstructured() -> None:
     """Dynamically imported as needed, due to slow import speed."""
+    global _unstructured_imported
     global unstructured_partition_pdf
     global unstructured_partition_docx
     global unstructured_partition_pptx
-    global unstructured_optional_decode
+    if _unstructured_imported:
+        return
     from unstructured.partition.docx import partition_docx
-    from unstructured.partition.md import optional_decode
     from unstructured.partition.pdf import partition_pdf
     from unstructured.partition.pptx import partition_pptx
 
@@ -36,10 +45,19 @@ def _import_unstructured() -> None:
     unstructured_partition_pdf = partition_pdf
     unstructured_partition_docx = partition_docx
     unstructured_partition_pptx = partition_pptx
-    unstructured_optional_decode = optional_decode
+    _unstructured_imported = True
 
 
 class UnstructuredParser(FileTypeParser):
+    _SUPPORTED_FILE_TYPES: FrozenSet[FileType] = frozenset(_EXTENSION_TO_FILETYPE.values())
+
+    # element categories with a dedicated markdown representation, all other elements are rendered as plain text
+    _MARKDOWN_FORMATTERS: Mapping[str, Callable[[Any], str]] = {
+        "Title": lambda el: f"{'#' * (el.metadata.category_depth or 1)} {el.text}",
+        "ListItem": lambda el: f"- {el.text}",
+        "Formula": lambda el: f"```\n{el.text}\n```",
+    }
+
     @property
     def parser_max_n_files_for_schema_inference(self) -> Optional[int]:
         """
@@ -65,7 +83,7 @@ class UnstructuredParser(FileTypeParser):
         with stream_reader.open_file(file, self.file_read_mode, None, logger) as file_handle:
             filetype = self._get_filetype(file_handle, file)
 
-            if filetype not in self._supported_file_types():
+            if filetype not in self._SUPPORTED_FILE_TYPES:
                 self._handle_unprocessable_file(file, format, logger)
 
             return {
@@ -91,26 +109,21 @@ class UnstructuredParser(FileTypeParser):
                 }
 
     def _read_file(self, file_handle: IOBase, remote_file: RemoteFile, format: UnstructuredFormat, logger: logging.Logger) -> Optional[str]:
-        _import_unstructured()
-        if (
-            (not unstructured_partition_pdf)
-            or (not unstructured_partition_docx)
-            or (not unstructured_partition_pptx)
-            or (not unstructured_optional_decode)
-        ):
-            # check whether unstructured library is actually available for better error message and to ensure proper typing (can't be None after this point)
-            raise Exception("unstructured library is not available")
-
         filetype = self._get_filetype(file_handle, remote_file)
 
         if filetype == FileType.MD:
+            # markdown is emitted as is, so there is no need to load the (slow to import) partitioning functions
             file_content: bytes = file_handle.read()
-            decoded_content: str = unstructured_optional_decode(file_content)
-            return decoded_content
-        if filetype not in self._supported_file_types():
+            return file_content.decode("utf-8")
+        if filetype not in self._SUPPORTED_FILE_TYPES:
             self._handle_unprocessable_file(remote_file, format, logger)
             return None
 
+        _import_unstructured()
+        if (not unstructured_partition_pdf) or (not unstructured_partition_docx) or (not unstructured_partition_pptx):
+            # check whether unstructured library is actually available for better error message and to ensure proper typing (can't be None after this point)
+            raise Exception("unstructured library is not available")
+
         file: Any = file_handle
         if filetype == FileType.PDF:
             # for PDF, read the file into a BytesIO object because some code paths in pdf parsing are doing an instance check on the file object and don't work with file-like objects
@@ -135,18 +148,28 @@ class UnstructuredParser(FileTypeParser):
         """
         Detect the file type based on the file name and the file content.
 
-        There are three strategies to determine the file type:
+        There are four strategies to determine the file type:
         1. Use the mime type if available (only some sources support it)
-        2. Use the file name if available
-        3. Use the file content
+        2. Use the file extension if it belongs to one of the supported file types
+        3. Use the file name if available
+        4. Use the file content
         """
-        if remote_file.mime_type and remote_file.mime_type in STR_TO_FILETYPE:
-            return STR_TO_FILETYPE[remote_file.mime_type]
-
         # set name to none, otherwise unstructured will try to get the modified date from the local file system
+        # this has to happen before any of the strategies returns, as partitioning relies on it as well
         if hasattr(file, "name"):
             file.name = None
 
+        if remote_file.mime_type:
+            file_type_from_mime_type = STR_TO_FILETYPE.get(remote_file.mime_type)
+            if file_type_from_mime_type is not None:
+                return file_type_from_mime_type
+
+        # the common case of a supported file extension doesn't need detect_filetype at all
+        _, extension = os.path.splitext(remote_file.uri)
+        file_type_from_extension = _EXTENSION_TO_FILETYPE.get(extension.lower())
+        if file_type_from_extension is not None:
+            return file_type_from_extension
+
         # detect_filetype is either using the file name or file content
         # if possible, try to leverage the file name to detect the file type
         # if the file name is not available, use the file content
@@ -163,22 +186,14 @@ class UnstructuredParser(FileTypeParser):
 
         return type_based_on_content
 
-    def _supported_file_types(self) -> List[Any]:
-        return [FileType.MD, FileType.PDF, FileType.DOCX, FileType.PPTX]
-
     def _render_markdown(self, elements: List[Any]) -> str:
-        return "\n\n".join((self._convert_to_markdown(el) for el in elements))
+        return "\n\n".join([self._convert_to_markdown(el) for el in elements])
 
     def _convert_to_markdown(self, el: Any) -> str:
-        if isinstance(el, Title):
-            heading_str = "#" * (el.metadata.category_depth or 1)
-            return f"{heading_str} {el.text}"
-        elif isinstance(el, ListItem):
-            return f"- {el.text}"
-        elif isinstance(el, Formula):
-            return f"```\n{el.text}\n```"
-        else:
-            return str(el.text) if hasattr(el, "text") else ""
+        formatter = self._MARKDOWN_FORMATTERS.get(getattr(el, "category", None))
+        if formatter is None:
+            return str(getattr(el, "text", ""))
+        return formatter(el)
 
     @property
     def file_read_mode(self) -> FileReadMode:
@@ -4,12 +4,14 @@
 
 import asyncio
 from datetime import datetime
+from io import BytesIO
 from unittest.mock import MagicMock, mock_open, patch
 
+import docx
 import pytest
 from airbyte_cdk.sources.file_based.config.unstructured_format import UnstructuredFormat
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
-from airbyte_cdk.sources.file_based.file_types import UnstructuredParser
+from airbyte_cdk.sources.file_based.file_types import UnstructuredParser, unstructured_parser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from unstructured.documents.elements import ElementMetadata, Formula, ListItem, Text, Title
 from unstructured.file_utils.filetype import FileType
@@ -17,6 +19,23 @@ from unstructured.file_utils.filetype import FileType
 FILE_URI = "path/to/file.xyz"
 
 
+class NamedBytesIO(BytesIO):
+    """In-memory file handle carrying the remote file name, like the handles returned by smart_open."""
+
+    def __init__(self, content: bytes, name: str) -> None:
+        super().__init__(content)
+        self.name = name
+
+
+@pytest.fixture(autouse=True)
+def reset_unstructured_import(monkeypatch):
+    # the partitioning functions are only imported once, reset them so each test picks up its own mocks
+    monkeypatch.setattr(unstructured_parser, "_unstructured_imported", False)
+    monkeypatch.setattr(unstructured_parser, "unstructured_partition_pdf", None)
+    monkeypatch.setattr(unstructured_parser, "unstructured_partition_docx", None)
+    monkeypatch.setattr(unstructured_parser, "unstructured_partition_pptx", None)
+
+
 @pytest.mark.parametrize(
     "filetype, format_config, raises",
     [
@@ -77,7 +96,7 @@ def test_infer_schema(mock_detect_filetype, filetype, format_config, raises):
         with pytest.raises(RecordParseError):
             loop.run_until_complete(UnstructuredParser().infer_schema(config, fake_file, stream_reader, logger))
     else:
-        schema = loop.run_until_complete(UnstructuredParser().infer_schema(config, MagicMock(), MagicMock(), MagicMock()))
+        schema = loop.run_until_complete(UnstructuredParser().infer_schema(config, fake_file, stream_reader, logger))
         assert schema == {
             "content": {"type": "string"},
             "document_key": {"type": "string"},
@@ -175,11 +194,9 @@ def test_infer_schema(mock_detect_filetype, filetype, format_config, raises):
 @patch("unstructured.partition.pdf.partition_pdf")
 @patch("unstructured.partition.pptx.partition_pptx")
 @patch("unstructured.partition.docx.partition_docx")
-@patch("unstructured.partition.md.optional_decode")
 @patch("airbyte_cdk.sources.file_based.file_types.unstructured_parser.detect_filetype")
 def test_parse_records(
     mock_detect_filetype,
-    mock_optional_decode,
     mock_partition_docx,
     mock_partition_pptx,
     mock_partition_pdf,
@@ -200,9 +217,56 @@ def test_parse_records(
     mock_partition_docx.return_value = parse_result
     mock_partition_pptx.return_value = parse_result
     mock_partition_pdf.return_value = parse_result
-    mock_optional_decode.side_effect = lambda x: x.decode("utf-8")
     if raises:
         with pytest.raises(RecordParseError):
             list(UnstructuredParser().parse_records(config, fake_file, stream_reader, logger, MagicMock()))
     else:
         assert list(UnstructuredParser().parse_records(config, fake_file, stream_reader, logger, MagicMock())) == expected_records
+
+
+@pytest.mark.parametrize(
+    "uri, mime_type, expected_filetype",
+    [
+        pytest.param("path/to/file.pdf", None, FileType.PDF, id="pdf extension"),
+        pytest.param("path/to/file.DOCX", None, FileType.DOCX, id="uppercase docx extension"),
+        pytest.param("path/to/file.md", None, FileType.MD, id="markdown extension"),
+        pytest.param("path/to/file.md", "application/pdf", FileType.PDF, id="mime type takes precedence"),
+    ],
+)
+@patch("airbyte_cdk.sources.file_based.file_types.unstructured_parser.detect_filetype")
+def test_get_filetype_without_detection(mock_detect_filetype, uri, mime_type, expected_filetype):
+    remote_file = RemoteFile(uri=uri, last_modified=datetime.now(), mime_type=mime_type)
+
+    assert UnstructuredParser()._get_filetype(MagicMock(), remote_file) == expected_filetype
+    mock_detect_filetype.assert_not_called()
+
+
+def test_parse_records_docx_with_remote_file_name():
+    document = docx.Document()
+    document.add_heading("Quarterly report", 1)
+    content = BytesIO()
+    document.save(content)
+    uri = "bucket/folder/report.docx"
+    stream_reader = MagicMock()
+    stream_reader.open_file.return_value.__enter__.return_value = NamedBytesIO(content.getvalue(), uri)
+    config = MagicMock()
+    config.format = UnstructuredFormat(skip_unprocessable_file_types=False)
+
+    fake_file = RemoteFile(uri=uri, last_modified=datetime.now())
+    records = list(UnstructuredParser().parse_records(config, fake_file, stream_reader, MagicMock(), MagicMock()))
+
+    assert records == [{"content": "# Quarterly report", "document_key": uri}]
+
+
+@patch("airbyte_cdk.sources.file_based.file_types.unstructured_parser._import_unstructured")
+def test_parse_records_markdown_does_not_import_partitioning(mock_import_unstructured):
+    stream_reader = MagicMock()
+    stream_reader.open_file.return_value.__enter__.return_value = BytesIO(b"# heading")
+    config = MagicMock()
+    config.format = UnstructuredFormat(skip_unprocessable_file_types=False)
+
+    fake_file = RemoteFile(uri="path/to/file.md", last_modified=datetime.now())
+    records = list(UnstructuredParser().parse_records(config, fake_file, stream_reader, MagicMock(), MagicMock()))
+
+    assert records == [{"content": "# heading", "document_key": "path/to/file.md"}]
+    mock_import_unstructured.assert_not_called()
@@ -4,6 +4,7 @@
 
 import argparse
 import sys
+from pathlib import Path
 from typing import Callable, Type
 
 import anyio
@@ -22,8 +23,7 @@ async def _generate_docs(dagger_client: dagger.Client):
     env = Environment(loader=FileSystemLoader("base_images/templates"))
     template = env.get_template("README.md.j2")
     rendered_template = template.render({"registries": await version_registry.get_all_registries(dagger_client, docker_credentials)})
-    with open("README.md", "w") as readme:
-        readme.write(rendered_template)
+    Path("README.md").write_text(rendered_template, encoding="utf-8")
     console.log("README.md generated successfully.")
 
 
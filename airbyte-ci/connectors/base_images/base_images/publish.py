@@ -3,13 +3,46 @@
 #
 
 
+from typing import Dict
+
+import anyio
 import dagger
-from base_images import bases, consts, published_image
+from base_images import bases, consts, errors, published_image
 
 
 async def run_sanity_checks(base_image_version: bases.AirbyteConnectorBaseImage):
-    for platform in consts.PLATFORMS_WE_PUBLISH_FOR:
-        await base_image_version.run_sanity_checks(platform)
+    """Runs the sanity checks of a base image on all the platforms we publish for.
+    The platforms are checked concurrently as each check is an independent dagger pipeline.
+    A failure on one platform does not cancel the checks of the other platforms: errors are only raised once all of them completed.
+
+    Args:
+        base_image_version (common.AirbyteConnectorBaseImage): The base image to check.
+
+    Raises:
+        Exception: Any error which is not a SanityCheckError (e.g. a dagger.QueryError), raised as is. If several platforms raised one, the error of the first platform in PLATFORMS_WE_PUBLISH_FOR is raised.
+        errors.SanityCheckError: If sanity checks failed on one or more platforms. The message lists every failing platform with its error.
+    """
+    errors_per_platform: Dict[dagger.Platform, Exception] = {}
+
+    async def run_sanity_checks_for_platform(platform: dagger.Platform):
+        try:
+            await base_image_version.run_sanity_checks(platform)
+        except Exception as e:
+            # Errors are collected instead of propagated so that the task group does not cancel the other platform checks
+            # and so that they can be raised in a deterministic order once all the checks completed.
+            errors_per_platform[platform] = e
+
+    async with anyio.create_task_group() as task_group:
+        for platform in consts.PLATFORMS_WE_PUBLISH_FOR:
+            task_group.start_soon(run_sanity_checks_for_platform, platform)
+
+    failures = [(platform, errors_per_platform[platform]) for platform in consts.PLATFORMS_WE_PUBLISH_FOR if platform in errors_per_platform]
+    for _, error in failures:
+        if not isinstance(error, errors.SanityCheckError):
+            raise error
+    if failures:
+        failure_messages = "\n".join(f"{platform}: {error}" for platform, error in failures)
+        raise errors.SanityCheckError(f"Sanity checks failed on {len(failures)} platform(s):\n{failure_messages}") from failures[0][1]
 
 
 async def publish_to_remote_registry(base_image_version: bases.AirbyteConnectorBaseImage) -> published_image.PublishedImage:
@@ -23,10 +56,8 @@ async def publish_to_remote_registry(base_image_version: bases.AirbyteConnectorB
     """
 
     address = f"{consts.REMOTE_REGISTRY}/{base_image_version.repository}:{base_image_version.version}"
-    variants_to_publish = []
-    for platform in consts.PLATFORMS_WE_PUBLISH_FOR:
-        await base_image_version.run_sanity_checks(platform)
-        variants_to_publish.append(base_image_version.get_container(platform))
+    await run_sanity_checks(base_image_version)
+    variants_to_publish = [base_image_version.get_container(platform) for platform in consts.PLATFORMS_WE_PUBLISH_FOR]
     # Publish with forced compression to ensure backward compatibility with older versions of docker
     published_address = await variants_to_publish[0].publish(
         address, platform_variants=variants_to_publish[1:], forced_compression=dagger.ImageLayerCompression.Gzip
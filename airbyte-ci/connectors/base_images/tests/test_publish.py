@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import anyio
+import pytest
+from base_images import consts, publish
+from base_images.errors import SanityCheckError
+
+pytestmark = [
+    pytest.mark.anyio,
+]
+
+AMD64, ARM64 = consts.PLATFORMS_WE_PUBLISH_FOR
+
+
+class TestRunSanityChecks:
+    @pytest.fixture
+    def base_image_version(self, mocker):
+        return mocker.Mock(run_sanity_checks=mocker.AsyncMock())
+
+    @staticmethod
+    def fail_on(errors_per_platform):
+        async def run_sanity_checks(platform):
+            # The first platform finishes last to make sure errors are not reported in completion order
+            if platform == AMD64:
+                await anyio.sleep(0.01)
+            if platform in errors_per_platform:
+                raise errors_per_platform[platform]
+
+        return run_sanity_checks
+
+    async def test_runs_checks_on_all_platforms(self, base_image_version):
+        await publish.run_sanity_checks(base_image_version)
+        checked_platforms = [call.args[0] for call in base_image_version.run_sanity_checks.call_args_list]
+        assert sorted(checked_platforms) == sorted(consts.PLATFORMS_WE_PUBLISH_FOR)
+
+    async def test_failure_on_one_platform(self, base_image_version):
+        base_image_version.run_sanity_checks.side_effect = self.fail_on({ARM64: SanityCheckError("wrong python version")})
+        with pytest.raises(SanityCheckError) as exc_info:
+            await publish.run_sanity_checks(base_image_version)
+        assert f"{ARM64}: wrong python version" in str(exc_info.value)
+        assert str(AMD64) not in str(exc_info.value)
+        assert base_image_version.run_sanity_checks.await_count == len(consts.PLATFORMS_WE_PUBLISH_FOR)
+
+    async def test_failures_on_all_platforms_are_reported_in_platform_order(self, base_image_version):
+        base_image_version.run_sanity_checks.side_effect = self.fail_on(
+            {AMD64: SanityCheckError("amd64 failure"), ARM64: SanityCheckError("arm64 failure")}
+        )
+        with pytest.raises(SanityCheckError) as exc_info:
+            await publish.run_sanity_checks(base_image_version)
+        message = str(exc_info.value)
+        assert message.index(f"{AMD64}: amd64 failure") < message.index(f"{ARM64}: arm64 failure")
+
+    async def test_other_errors_are_raised_unwrapped(self, base_image_version):
+        engine_error = RuntimeError("dagger engine error")
+        base_image_version.run_sanity_checks.side_effect = self.fail_on({AMD64: engine_error, ARM64: SanityCheckError("arm64 failure")})
+        with pytest.raises(RuntimeError) as exc_info:
+            await publish.run_sanity_checks(base_image_version)
+        assert exc_info.value is engine_error
+        assert base_image_version.run_sanity_checks.await_count == len(consts.PLATFORMS_WE_PUBLISH_FOR)